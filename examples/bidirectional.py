@@ -1,11 +1,14 @@
 # Copyright (2017-2020)
 # The Wormnet project
 # Mathias Lechner (mlechner@ist.ac.at)
+from functools import partial
+
 import numpy as np
 import mlx.core as mx
 import mlx.nn as nn
-from ncps.mlx import LTC, EnhancedLTCCell
-from ncps import wirings
+import mlx.optimizers as optim
+from ncps.mlx import ELTCCell
+from ncps.mlx.wirings import AutoNCP
 
 def generate_data(N):
     # Generate data
@@ -26,34 +29,35 @@ N = 48
 data_x, data_y = generate_data(N)
 
 # Use AutoNCP wiring
-auto_ncp = wirings.AutoNCP(32, 1)  # 32 neurons, 1 output
+auto_ncp = AutoNCP(32, 1)  # 32 neurons, 1 output
+auto_ncp.build(data_x.shape[-1])
 
 # Create bidirectional model using MLX
 class BidirectionalRNN(nn.Module):
     def __init__(self):
         super().__init__()
-        self.forward_rnn = LTC(auto_ncp, cell_class=EnhancedLTCCell, solver="rk4", ode_unfolds=6)
-        self.backward_rnn = LTC(auto_ncp, cell_class=EnhancedLTCCell, solver="rk4", ode_unfolds=6)
+        self.forward_rnn = ELTCCell(auto_ncp, solver="fused", ode_unfolds=6)
+        self.backward_rnn = ELTCCell(auto_ncp, solver="fused", ode_unfolds=6)
         self.dense = nn.Linear(auto_ncp.units * 2, 1)  # *2 for bidirectional
     
     def __call__(self, x):
-        # Forward pass
+        # Forward pass, keeping the full neuron states for the dense layer
         h_forward = None
         forward_outputs = []
         for t in range(x.shape[1]):
-            y, h_forward = self.forward_rnn(x[:, t:t+1, :], h_forward)
-            forward_outputs.append(y)
+            _, h_forward = self.forward_rnn(x[:, t], h_forward)
+            forward_outputs.append(h_forward)
         
         # Backward pass
         h_backward = None
         backward_outputs = []
         for t in range(x.shape[1]-1, -1, -1):
-            y, h_backward = self.backward_rnn(x[:, t:t+1, :], h_backward)
-            backward_outputs.insert(0, y)
+            _, h_backward = self.backward_rnn(x[:, t], h_backward)
+            backward_outputs.insert(0, h_backward)
         
         # Concatenate forward and backward outputs
-        forward_seq = mx.concatenate(forward_outputs, axis=1)
-        backward_seq = mx.concatenate(backward_outputs, axis=1)
+        forward_seq = mx.stack(forward_outputs, axis=1)
+        backward_seq = mx.stack(backward_outputs, axis=1)
         combined = mx.concatenate([forward_seq, backward_seq], axis=-1)
         
         # Apply dense layer
@@ -62,27 +66,39 @@ class BidirectionalRNN(nn.Module):
 model = BidirectionalRNN()
 
 # Training parameters
-optimizer = nn.optimizers.Adam(learning_rate=0.01)
+optimizer = optim.Adam(learning_rate=0.01)
 
-# Training loop
-def train_step(model, x, y):
-    def loss_fn(model, x, y):
-        return mx.mean(mx.square(model(x) - y))
-    
-    loss_and_grad = nn.value_and_grad(model, loss_fn)
-    loss, grads = loss_and_grad(model, x, y)
+def loss_fn(model, x, y):
+    prediction = model(x)
+    return mx.mean(mx.square(prediction - y)), prediction
+
+loss_and_grad = nn.value_and_grad(model, loss_fn)
+
+# Create the optimizer state before tracing to give the compiled step a
+# fixed state tree
+optimizer.init(model.trainable_parameters())
+state = [model.state, optimizer.state]
+
+# The data always has shape [1, N, 2], so the default shape-specialized
+# compile traces both LTCs once and reuses that graph every epoch
+@partial(mx.compile, inputs=state, outputs=state)
+def train_step(x, y):
+    (loss, prediction), grads = loss_and_grad(model, x, y)
     optimizer.update(model, grads)
-    return loss
+    # Keep the synaptic weights and membrane parameters non-negative
+    model.forward_rnn.apply_weight_constraints()
+    model.backward_rnn.apply_weight_constraints()
+    return loss, prediction
 
 # Train the model
 for epoch in range(200):
-    loss = train_step(model, data_x, data_y)
-    mx.eval(loss)
+    loss, prediction = train_step(data_x, data_y)
+    mx.eval(loss, prediction, state)
     if epoch % 10 == 0:
         print(f"Epoch {epoch+1} | Loss: {loss.item():.4f}")
 
-# Test inference
-with mx.eval_mode():
-    prediction = model(data_x)
-    final_loss = mx.mean(mx.square(prediction - data_y))
-    print(f"\nFinal MSE: {final_loss.item():.4f}")
+# The last training step already ran both LTCs over data_x, so reuse
+# its prediction instead of a second full forward pass. It was made before
+# that step's update, so it scores the parameters of the last training step
+final_loss = mx.mean(mx.square(prediction - data_y))
+print(f"\nLast training-step MSE: {final_loss.item():.4f}")
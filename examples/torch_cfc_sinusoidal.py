@@ -1,7 +1,8 @@
 import mlx.core as mx
 import mlx.nn as nn
-from ncps import wirings
-from ncps.mlx import CfC, WiredCfCCell
+import mlx.optimizers as optim
+from ncps.mlx import CfC
+from ncps.mlx.wirings import FullyConnected, NCP
 
 # Data preparation using MLX ops
 N = 48  # Length of the time-series
@@ -20,33 +21,13 @@ t_out = mx.linspace(0, 6 * mx.pi, N)
 data_y = mx.sin(t_out)
 data_y = mx.reshape(data_y, [1, N, 1])
 
-# List of model configurations
-model_configs = [
-    CfC(units=32),
-    WiredCfCCell(
-        wiring=wirings.FullyConnected(8, out_features)
-    ),
-    WiredCfCCell(
-        wiring=wirings.NCP(
-            inter_neurons=16,
-            command_neurons=8,
-            motor_neurons=out_features,
-            sensory_fanout=12,
-            inter_fanout=4,
-            recurrent_command_synapses=5,
-            motor_fanin=8,
-        )
-    ),
-    CfC(
-        units=32,
-        mode="pure"
-    ),
-    WiredCfCCell(
-        wiring=wirings.FullyConnected(8, out_features),
-        mode="pure"
-    ),
-    WiredCfCCell(
-        wiring=wirings.NCP(
+# List of model configurations, each run in the default and pure modes.
+# The two-layer backbone applies dropout between its layers while training
+def make_wirings():
+    return [
+        FullyConnected(32, out_features),
+        FullyConnected(8, out_features),
+        NCP(
             inter_neurons=16,
             command_neurons=8,
             motor_neurons=out_features,
@@ -55,29 +36,25 @@ model_configs = [
             recurrent_command_synapses=5,
             motor_fanin=8,
         ),
-        mode="pure"
-    ),
-]
-
-# Training using MLX
-class Model(nn.Module):
-    def __init__(self, rnn_cell):
-        super().__init__()
-        self.rnn = rnn_cell
-        
-    def __call__(self, x, training=True):
-        # Process sequence
-        h = None
-        outputs = []
-        for t in range(x.shape[1]):
-            y, h = self.rnn(x[:, t:t+1, :], h)
-            outputs.append(y)
-        return mx.concatenate(outputs, axis=1)
+    ]
 
-# Training parameters
-optimizer = nn.optimizers.Adam(learning_rate=0.01)
+model_configs = []
+for mode in ["default", "pure"]:
+    for wiring in make_wirings():
+        wiring.build(in_features)
+        model_configs.append(
+            CfC(
+                wiring=wiring,
+                mode=mode,
+                return_sequences=True,
+                backbone_units=64,
+                backbone_layers=2,
+                backbone_dropout=0.1,
+            )
+        )
 
-def train_step(model, x, y):
+# Training using MLX
+def train_step(model, optimizer, x, y):
     def loss_fn(model, x, y):
         return mx.mean(mx.square(model(x) - y))
     
@@ -87,17 +64,23 @@ def train_step(model, x, y):
     return loss
 
 # Train each model configuration
-for rnn_cell in model_configs:
-    model = Model(rnn_cell)
-    print(f"\nTraining model: {rnn_cell.__class__.__name__}")
+for model in model_configs:
+    name = f"{model.__class__.__name__} ({model.hidden_size} units, {model.forward_layers[0].mode})"
+    print(f"\nTraining model: {name}")
+    optimizer = optim.Adam(learning_rate=0.002)
+    
+    # Parameters are created lazily on the first call, so build them before
+    # the first gradient step to let every step see the full parameter tree
+    model(data_x)
     
     # Training loop
+    model.train()
     for epoch in range(10):
-        loss = train_step(model, data_x, data_y)
+        loss = train_step(model, optimizer, data_x, data_y)
         mx.eval(loss)
         print(f"Epoch {epoch+1} | Loss: {loss.item():.4f}")
     
-    # Evaluate
-    with mx.eval_mode():
-        final_loss = mx.mean(mx.square(model(data_x) - data_y))
-        print(f"\nFinal MSE for {rnn_cell.__class__.__name__}: {final_loss.item():.4f}")
+    # Evaluate in eval mode so backbone dropout is skipped entirely
+    model.eval()
+    final_loss = mx.mean(mx.square(model(data_x) - data_y))
+    print(f"\nFinal MSE for {name}: {final_loss.item():.4f}")
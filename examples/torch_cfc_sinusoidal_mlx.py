@@ -1,73 +1,113 @@
 # Copyright (2017-2021)
 # The Wormnet project
 # Mathias Lechner (mlechner@ist.ac.at)
+import math
+from functools import partial
+
 import mlx.core as mx
 import mlx.nn as nn
 import mlx.optimizers as optim
+from mlx.utils import tree_flatten, tree_map
 from ncps.mlx import CfC
-from ncps.wirings import FullyConnected, NCP
+from ncps.mlx.wirings import FullyConnected, NCP
 
-def train_model(model, x, y, num_epochs=10, learning_rate=0.005):
+def make_train_step(model, x, learning_rate=0.005, max_grad_norm=1.0):
     optimizer = optim.Adam(learning_rate=learning_rate)
-    
+
     def loss_fn(model, x, y):
         y_pred = model(x)
         return nn.losses.mse_loss(y_pred, y)
-    
-    for epoch in range(num_epochs):
-        loss_value = loss_fn(model, x, y)
-        grads = mx.grad(loss_fn)(model, x, y)
+
+    loss_and_grad = nn.value_and_grad(model, loss_fn)
+
+    # Parameters and optimizer state are created lazily, so materialize them
+    # before tracing to give the compiled step a fixed state tree
+    model(x)
+    optimizer.init(model.trainable_parameters())
+    state = [model.state, optimizer.state]
+
+    @partial(mx.compile, inputs=state, outputs=state)
+    def step(x, y):
+        loss, grads = loss_and_grad(model, x, y)
+        # Clip without a Python branch so the norm never has to reach the host.
+        # tree_flatten only runs while the step is traced; later calls replay
+        # the compiled graph and never walk the gradient tree in Python
+        sq_sums = mx.stack([mx.sum(g * g) for _, g in tree_flatten(grads)])
+        grad_norm = mx.sqrt(mx.sum(sq_sums))
+        scale = mx.minimum(1.0, max_grad_norm / (grad_norm + 1e-6))
+        grads = tree_map(lambda g: g * scale, grads)
         optimizer.update(model, grads)
-        mx.eval(model.parameters())  # Ensure updates are applied
-        print(f"Epoch {epoch+1}, Loss: {float(loss_value)}")
+        return loss
+
+    return step, state
+
+def train_models(models, x, y, num_epochs=10, learning_rate=0.005, max_grad_norm=1.0, log_every=5):
+    steps, states = [], []
+    for model in models:
+        step, state = make_train_step(model, x, learning_rate, max_grad_norm)
+        steps.append(step)
+        states.append(state)
+
+    # The models are independent, so queue every step before a single eval
+    # and let MLX interleave their graphs instead of syncing after each one.
+    # Evaluation itself is a barrier, so steps are queued for log_every
+    # epochs and the losses are only materialized at that boundary
+    active = list(range(len(models)))
+    history = {i: [] for i in active}
+    for epoch in range(num_epochs):
+        for i in active:
+            history[i].append(steps[i](x, y))
+
+        if (epoch + 1) % log_every == 0 or epoch + 1 == num_epochs:
+            mx.eval([history[i] for i in active], [states[i] for i in active])
+            for i in list(active):
+                losses = [loss.item() for loss in history[i]]
+                history[i] = []
+                if any(math.isnan(loss) for loss in losses):
+                    print(f"Model {i}, Epoch {epoch+1}, Loss is NaN, stopping")
+                    active.remove(i)
+                else:
+                    print(f"Model {i}, Epoch {epoch+1}, Loss: {losses[-1]}")
+            if not active:
+                break
 
 # Generate data
 N = 48
 in_features = 2
 out_features = 1
 
-data_x = mx.stack([
-    mx.sin(mx.linspace(0, 3 * mx.pi, N)), 
-    mx.cos(mx.linspace(0, 3 * mx.pi, N))
-], axis=1)
+# Both channels come from one sin over a shared t, since cos(t) = sin(t + pi/2)
+t = mx.linspace(0, 3 * mx.pi, N)
+data_x = mx.sin(t[:, None] + mx.array([0.0, mx.pi / 2]))
 data_x = mx.expand_dims(data_x, axis=0)
 data_y = mx.sin(mx.linspace(0, 6 * mx.pi, N)).reshape(1, N, 1)
 
+# Materialize the data once so every compiled step receives concrete arrays
+# instead of re-tracing the sin/cos construction
+mx.eval(data_x, data_y)
+
 # Initialize with explicit random seed for reproducibility
 mx.random.seed(42)
 
 # Test different model configurations
-models = [
-    CfC(
-        32,  # units
-        input_dim=in_features,
-        output_dim=out_features,  # Add missing output dimension
-        return_sequences=True
-    ),
-    CfC(
-        8,  # units
-        input_dim=in_features,
-        output_dim=out_features,
-        return_sequences=True,
-        wiring=FullyConnected(8, out_features)
-    ),
-    CfC(
-        24,  # total neurons (16 + 8)
-        input_dim=in_features,
-        output_dim=out_features,
-        return_sequences=True,
-        wiring=NCP(
-            inter_neurons=16,
-            command_neurons=8,
-            motor_neurons=out_features,
-            sensory_fanout=12,
-            inter_fanout=4,
-            recurrent_command_synapses=5,
-            motor_fanin=8,
-        )
+wirings = [
+    FullyConnected(32, out_features),
+    FullyConnected(8, out_features),
+    NCP(
+        inter_neurons=16,
+        command_neurons=8,
+        motor_neurons=out_features,
+        sensory_fanout=12,
+        inter_fanout=4,
+        recurrent_command_synapses=5,
+        motor_fanin=8,
     ),
 ]
+models = []
+for wiring in wirings:
+    wiring.build(in_features)
+    models.append(CfC(wiring=wiring, return_sequences=True))
 
-for model in models:
-    print(f"\nTraining {model.__class__.__name__}")
-    train_model(model, data_x, data_y)
+for i, model in enumerate(models):
+    print(f"Model {i}: {model.__class__.__name__} ({model.hidden_size} units)")
+train_models(models, data_x, data_y)
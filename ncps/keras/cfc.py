@@ -85,6 +85,11 @@ class CfC(keras.Model):
     
     def build(self, input_shape):
         """Build the layer."""
+        # [inputs, times] are packed into one tensor in call()
+        if isinstance(input_shape, (list, tuple)) and isinstance(input_shape[0], (list, tuple)):
+            self.cell.time_input = True
+            input_shape = tuple(input_shape[0][:-1]) + (input_shape[0][-1] + 1,)
+        
         # Build RNN
         self.rnn.build(input_shape)
         self.built = True
@@ -93,7 +98,8 @@ class CfC(keras.Model):
         """Process input sequence.
         
         Args:
-            inputs: Input tensor or list of tensors
+            inputs: Input tensor, or list of [inputs, elapsed times] where the
+                times have shape [batch_size, seq_len] or [batch_size, seq_len, 1]
             training: Whether in training mode
             mask: Optional mask tensor
             initial_state: Optional initial state
@@ -101,9 +107,16 @@ class CfC(keras.Model):
         Returns:
             Output tensor or list of tensors
         """
-        # Handle inputs
+        # Pack the elapsed times as one extra feature so the RNN steps over a
+        # single contiguous tensor instead of a nested structure
         if isinstance(inputs, (list, tuple)):
-            inputs = inputs[0]  # Ignore time inputs for now
+            inputs, t = inputs
+            if len(t.shape) == 2:
+                t = keras.ops.expand_dims(t, axis=-1)
+            t = keras.ops.cast(t, inputs.dtype)
+            inputs = keras.ops.concatenate([inputs, t], axis=-1)
+            if isinstance(mask, (list, tuple)):
+                mask = mask[0]
         
         # Call RNN
         return self.rnn(
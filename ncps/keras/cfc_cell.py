@@ -57,6 +57,10 @@ class CfCCell(LiquidCell):
         self.backbone_dropout = backbone_dropout
         self.backbone = None
         
+        # Set by the CfC layer when the elapsed time is packed as the last
+        # input feature
+        self.time_input = False
+        
         # Calculate backbone dimensions
         self.backbone_input_dim = self.input_size + self.units
         if backbone_layers > 0 and backbone_units:
@@ -99,8 +103,8 @@ class CfCCell(LiquidCell):
     
     def build(self, input_shape):
         """Build cell parameters."""
-        # Set input dimension
-        input_dim = input_shape[-1]
+        # Set input dimension (excluding a packed time feature)
+        input_dim = input_shape[-1] - 1 if self.time_input else input_shape[-1]
         self.input_size = input_dim
         self.backbone_input_dim = self.input_size + self.units
         
@@ -183,7 +187,9 @@ class CfCCell(LiquidCell):
         """Process one step with the cell.
         
         Args:
-            inputs: Input tensor of shape [batch_size, input_size]
+            inputs: Input tensor of shape [batch_size, input_size], or
+                [batch_size, input_size + 1] with the elapsed time packed
+                as the last feature
             states: Previous state tensors
             training: Whether in training mode
             
@@ -193,6 +199,12 @@ class CfCCell(LiquidCell):
         # Get current state
         state = states[0]
         
+        # Slice the packed elapsed time off the inputs
+        if self.time_input:
+            inputs, t = inputs[:, :-1], inputs[:, -1:]
+        else:
+            t = 1.0
+        
         # Process input
         x = layers.concatenate([inputs, state])
         if self.backbone is not None:
@@ -200,9 +212,9 @@ class CfCCell(LiquidCell):
         
         # Apply transformations
         if self.mode == "pure":
-            new_state = self._pure_step(x)
+            new_state = self._pure_step(x, t)
         else:
-            new_state = self._gated_step(x)
+            new_state = self._gated_step(x, t)
         
         # Project output if needed
         if self.output_size != self.units:
@@ -212,25 +224,25 @@ class CfCCell(LiquidCell):
         
         return output, [new_state]
     
-    def _pure_step(self, x):
+    def _pure_step(self, x, t=1.0):
         """Execute pure mode step."""
         ff1 = ops.matmul(x, self.ff1_kernel) + self.ff1_bias
         new_state = (
             -self.A 
-            * ops.exp(-(ops.abs(self.w_tau) + ops.abs(ff1))) 
+            * ops.exp(-t * (ops.abs(self.w_tau) + ops.abs(ff1))) 
             * ff1 
             + self.A
         )
         return new_state
     
-    def _gated_step(self, x):
+    def _gated_step(self, x, t=1.0):
         """Execute gated mode step."""
         ff1 = ops.matmul(x, self.ff1_kernel) + self.ff1_bias
         ff2 = ops.matmul(x, self.ff2_kernel) + self.ff2_bias
         
         t_a = self.time_a(x)
         t_b = self.time_b(x)
-        t_interp = activations.sigmoid(-t_a + t_b)
+        t_interp = activations.sigmoid(-t_a * t + t_b)
         
         if self.mode == "no_gate":
             new_state = ff1 + t_interp * ff2
@@ -17,7 +17,7 @@ from .eltc_cell import ELTCCell
 from .mm_rnn import MMRNN
 from .wired_cfc_cell import WiredCfCCell
 from .wired_eltc_cell import WiredELTCCell
-from .utils import save_model, load_model
+from .utils import save_model, load_model, quantize_backbone
 
 __all__ = [
     # Base cells
@@ -41,6 +41,7 @@ __all__ = [
     # Utilities
     "save_model",
     "load_model",
+    "quantize_backbone",
 ]
 
 # Version of the ncps.mlx package
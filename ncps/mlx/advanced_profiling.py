@@ -7,6 +7,7 @@ including compute, memory, and stream profiling capabilities.
 import time
 from typing import Dict, List, Optional, Tuple, Union
 import mlx.core as mx
+import mlx.nn as nn
 import numpy as np
 from ncps.mlx.wirings import Wiring
 
@@ -179,8 +180,8 @@ class MLXProfiler:
             pred = model(x)
             return mx.mean(pred ** 2)
         
-        loss, grads = mx.value_and_grad(self.model, loss_fn)(self.model, x)
-        mx.eval()
+        loss, grads = nn.value_and_grad(self.model, loss_fn)(self.model, x)
+        mx.eval(loss, grads)
         
         # Get stream stats
         stats = mx.stream_stats()
@@ -2,6 +2,7 @@
 
 import mlx.core as mx
 import mlx.nn as nn
+from functools import partial
 from typing import Optional, Tuple, List, Dict, Any
 
 from .base import LiquidCell
@@ -9,6 +10,26 @@ from .liquid_utils import get_activation
 from .typing import InitializerCallable
 
 
+@partial(mx.compile, shapeless=True)
+def _pure_update(ff1, w_tau, A, time):
+    """Fused closed-form update of the pure CfC mode."""
+    return -A * mx.exp(-time * (mx.abs(w_tau) + mx.abs(ff1))) * ff1 + A
+
+
+@partial(mx.compile, shapeless=True)
+def _gated_update(ff1, ff2, t_a, t_b, time):
+    """Fused time-gated interpolation of the default CfC mode."""
+    t_interp = nn.sigmoid(-t_a * time + t_b)
+    return ff1 * (1.0 - t_interp) + t_interp * ff2
+
+
+@partial(mx.compile, shapeless=True)
+def _no_gate_update(ff1, ff2, t_a, t_b, time):
+    """Fused time-gated update of the no_gate CfC mode."""
+    t_interp = nn.sigmoid(-t_a * time + t_b)
+    return ff1 + t_interp * ff2
+
+
 class CfCCell(LiquidCell):
     """A Closed-form Continuous-time (CfC) cell."""
     
@@ -69,12 +90,7 @@ class CfCCell(LiquidCell):
         if self.mode == "pure":
             if isinstance(time, mx.array):
                 time = time[:, None]  # Add dimension for broadcasting
-            new_state = (
-                -self.A 
-                * mx.exp(-time * (mx.abs(self.w_tau) + mx.abs(ff1))) 
-                * ff1 
-                + self.A
-            )
+            new_state = _pure_update(ff1, self.w_tau, self.A, time)
         else:
             ff2 = mx.matmul(concat_input, self.ff2_kernel) + self.ff2_bias
                 
@@ -82,12 +98,12 @@ class CfCCell(LiquidCell):
             t_b = self.time_b(concat_input)
             if isinstance(time, mx.array):
                 time = time[:, None]  # Add dimension for broadcasting
-            t_interp = nn.sigmoid(-t_a * time + t_b)
             
+            # The elementwise gating runs as a single compiled kernel
             if self.mode == "no_gate":
-                new_state = ff1 + t_interp * ff2
+                new_state = _no_gate_update(ff1, ff2, t_a, t_b, time)
             else:
-                new_state = ff1 * (1.0 - t_interp) + t_interp * ff2
+                new_state = _gated_update(ff1, ff2, t_a, t_b, time)
         
         # Project to output dimension if different from hidden size
         output = new_state
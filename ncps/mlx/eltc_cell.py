@@ -2,20 +2,94 @@
 
 import mlx.core as mx
 import mlx.nn as nn
+from mlx.utils import tree_flatten, tree_unflatten
 from typing import Optional, Dict, Any, Callable
 
+from . import wirings
 from .ltc_cell import LTCCell
 from .ode_solvers import rk4_solve, euler_solve, semi_implicit_solve
 
 
+# Uniform initialization ranges of the ODE parameters
+DEFAULT_INIT_RANGES = {
+    "gleak": (0.001, 1.0),
+    "vleak": (-0.2, 0.2),
+    "cm": (0.4, 0.6),
+    "w": (0.001, 1.0),
+    "sigma": (3, 8),
+    "mu": (0.3, 0.8),
+    "sensory_w": (0.001, 1.0),
+    "sensory_sigma": (3, 8),
+    "sensory_mu": (0.3, 0.8),
+}
+
+
+def _checkpoint(module, fn):
+    """Wrap a method so backprop recomputes it instead of storing its intermediates.
+
+    Works like ``nn.utils.checkpoint``, but makes the cotangents returned by one
+    call depend on each other. MLX otherwise leaves the parameter cotangents of
+    every call pending until they are summed at the end of backprop, which keeps
+    all recomputed intermediates alive at once and cancels the memory saving.
+
+    Args:
+        module: Module whose trainable parameters ``fn`` reads
+        fn: Function to checkpoint; non-array arguments are passed through
+
+    Returns:
+        Checkpointed function with the same signature as ``fn``
+    """
+    @mx.custom_function
+    def checkpointed_fn(params, *args):
+        module.update(params)
+        return fn(*args)
+
+    @checkpointed_fn.vjp
+    def checkpointed_fn_vjp(primals, cotangent, output):
+        params, *args = primals
+        keys, values = zip(*tree_flatten(params))
+        positions = [i for i, arg in enumerate(args) if isinstance(arg, mx.array)]
+        num_params = len(values)
+
+        def recompute(*arrays):
+            module.update(tree_unflatten(list(zip(keys, arrays[:num_params]))))
+            call_args = list(args)
+            for i, array in zip(positions, arrays[num_params:]):
+                call_args[i] = array
+            return fn(*call_args)
+
+        # Recompute from the inputs once the forward output exists
+        arrays = mx.depends([*values, *(args[i] for i in positions)], [output])
+        _, vjps = mx.vjp(recompute, arrays, [cotangent])
+        module.update(params)
+
+        # Finish every cotangent of this call before backprop moves on
+        vjps = mx.depends(vjps, vjps)
+        arg_vjps = [None] * len(args)
+        for i, vjp in zip(positions, vjps[num_params:]):
+            arg_vjps[i] = vjp
+        return (tree_unflatten(list(zip(keys, vjps[:num_params]))), *arg_vjps)
+
+    def wrapped_fn(*args):
+        return checkpointed_fn(module.trainable_parameters(), *args)
+
+    return wrapped_fn
+
+
 class ELTCCell(LTCCell):
     """
     Enhanced Liquid Time-Constant Cell (ELTC) for MLX.
 
     This class extends the LTCCell implementation by adding:
-    - Configurable solvers (e.g., RK4, Euler, Semi-Implicit)
+    - Configurable solvers (e.g., RK4, Euler, Semi-Implicit, Fused)
     - Sparsity constraints for adjacency matrices
     - Flexible activation functions
+
+    The explicit solvers integrate ``cm * dv/dt = gleak * (vleak - v) +
+    sum_j w_j * sigmoid_j(v) * (erev_j - v)`` and are only stable while
+    ``(gleak + sum_j w_j) * dt / cm`` stays small, so raise ``ode_unfolds``
+    if training drives ``cm`` down. The fused solver is the semi-implicit
+    LTC update, which is stable for any step size.
     """
 
     def __init__(
@@ -30,6 +104,7 @@ class ELTCCell(LTCCell):
         forget_gate_bias: float = 1.0,
         sparsity: float = 0.5,
         activation: Callable = mx.tanh,
+        checkpoint_every: int = 0,
         **kwargs,
     ):
         """
@@ -39,46 +114,107 @@ class ELTCCell(LTCCell):
             wiring: Neural wiring pattern
             input_mapping: Input mapping type ("affine" or "linear")
             output_mapping: Output mapping type ("affine" or "linear")
-            solver: Solver type for ODE solving ("rk4", "euler", "semi_implicit")
+            solver: Solver type for ODE solving ("rk4", "euler", "semi_implicit", "fused")
             ode_unfolds: Number of ODE unfolds per time step
             epsilon: Small constant to avoid division by zero
             initialization_ranges: Ranges for parameter initialization
             forget_gate_bias: Bias for the forget gate
             sparsity: Sparsity level for adjacency matrices
             activation: Activation function
+            checkpoint_every: Number of ODE unfolds per gradient checkpoint.
+                Backprop keeps only the state between chunks and recomputes
+                the solver stages inside each chunk (0 disables)
             **kwargs: Additional arguments passed to the base LTCCell
         """
-        super().__init__(
-            wiring=wiring,
-            input_mapping=input_mapping,
-            output_mapping=output_mapping,
-            ode_unfolds=ode_unfolds,
-            epsilon=epsilon,
-            initialization_ranges=initialization_ranges,
-            forget_gate_bias=forget_gate_bias,
-            **kwargs,
-        )
+        super().__init__(wiring=wiring, **kwargs)
+        self.input_mapping = input_mapping
+        self.output_mapping = output_mapping
         self.solver = solver
+        self._ode_unfolds = ode_unfolds
+        self.epsilon = epsilon
+        self.initialization_ranges = {**DEFAULT_INIT_RANGES, **(initialization_ranges or {})}
+        self.forget_gate_bias = forget_gate_bias
         self.sparsity = sparsity
         self.activation = activation
+        self.checkpoint_every = checkpoint_every
+        self.output_dim = wiring.output_dim or wiring.units
+
+        # Built once and reused for every chunk of every step; the chunk size
+        # is passed through as a plain argument
+        self._checkpointed_unfold = _checkpoint(self, self._ode_unfold)
+
+        # Build the parameters if the input dimension is known
+        if wiring.input_dim is not None:
+            self.build()
 
     def build(self):
         """Initialize parameters."""
-        super().build()
+        units = self.units
+        input_dim = self.wiring.input_dim
+
+        self.gleak = self._init_param((units,), "gleak")
+        self.vleak = self._init_param((units,), "vleak")
+        self.cm = self._init_param((units,), "cm")
+        self.sigma = self._init_param((units, units), "sigma")
+        self.mu = self._init_param((units, units), "mu")
+        self.weight = self._init_param((units, units), "w")
+        self.erev = self.wiring.erev_initializer()
+
+        self.sensory_sigma = self._init_param((input_dim, units), "sensory_sigma")
+        self.sensory_mu = self._init_param((input_dim, units), "sensory_mu")
+        self.sensory_weight = self._init_param((input_dim, units), "sensory_w")
+        self.sensory_erev = self.wiring.sensory_erev_initializer()
+
+        # Underscored arrays are not trainable parameters
+        self._sparsity_mask = mx.abs(self.wiring.adjacency_matrix)
+        self._sensory_sparsity_mask = mx.abs(self.wiring.sensory_adjacency_matrix)
+
+        if self.input_mapping in ["affine", "linear"]:
+            self.input_w = mx.ones((input_dim,))
+        if self.input_mapping == "affine":
+            self.input_b = mx.zeros((input_dim,))
+        if self.output_mapping in ["affine", "linear"]:
+            self.output_w = mx.ones((self.output_dim,))
+        if self.output_mapping == "affine":
+            self.output_b = mx.zeros((self.output_dim,))
+
         self._apply_sparsity()
 
+    def _init_param(self, shape, name):
+        """Draw a parameter uniformly from its initialization range."""
+        low, high = self.initialization_ranges[name]
+        if low == high:
+            return mx.full(shape, low)
+        return mx.random.uniform(low=low, high=high, shape=shape)
+
     def _apply_sparsity(self):
         """Apply sparsity constraints to the adjacency matrix."""
-        if not hasattr(self, 'weight'):
-            return  # Skip if params not yet initialized
-            
-        # Use bernoulli for sparsity mask
-        mask = mx.random.bernoulli(1 - self.sparsity, self.weight.shape)
-        self.weight = self.weight * mask
+        if self.sparsity <= 0:
+            return
+
+        # Drop recurrent synapses through the mask so they stay pruned in training
+        keep = mx.random.bernoulli(1 - self.sparsity, self._sparsity_mask.shape)
+        self._sparsity_mask = self._sparsity_mask * keep
+
+    def apply_weight_constraints(self):
+        """Clip the parameters that must stay non-negative; call after each update."""
+        self.weight = mx.maximum(self.weight, 0)
+        self.sensory_weight = mx.maximum(self.sensory_weight, 0)
+        self.cm = mx.maximum(self.cm, 0)
+        self.gleak = mx.maximum(self.gleak, 0)
 
     def _sigmoid(self, v, mu, sigma):
-        """Compute sigmoid activation."""
-        return 1.0 / (1.0 + mx.exp(-(v - mu) / sigma))
+        """Compute the synaptic activation of every (source, target) pair.
+
+        Args:
+            v: Presynaptic potentials of shape [batch_size, num_sources]
+            mu: Offsets of shape [num_sources, num_targets]
+            sigma: Scales of shape [num_sources, num_targets]
+
+        Returns:
+            Activations of shape [batch_size, num_sources, num_targets]
+        """
+        return mx.sigmoid(sigma * (mx.expand_dims(v, -1) - mu))
 
     def ode_solver(self, f, y0, t0, dt):
         """
@@ -120,32 +256,101 @@ class ELTCCell(LTCCell):
         sensory_w_activation = self.sensory_weight * self._sigmoid(
             inputs, self.sensory_mu, self.sensory_sigma
         )
+        sensory_w_activation = sensory_w_activation * self._sensory_sparsity_mask
 
         sensory_rev_activation = sensory_w_activation * self.sensory_erev
 
+        # Reduce over the source sensory neurons
         w_numerator_sensory = mx.sum(sensory_rev_activation, axis=1)
         w_denominator_sensory = mx.sum(sensory_w_activation, axis=1)
 
-        cm_t = self.cm / (elapsed_time / self._ode_unfolds)
+        if isinstance(elapsed_time, mx.array):
+            elapsed_time = mx.reshape(elapsed_time, (-1, 1))
+        dt = elapsed_time / self._ode_unfolds
+
+        if self.checkpoint_every <= 0:
+            return self._ode_unfold(
+                v_pre, w_numerator_sensory, w_denominator_sensory, dt, self._ode_unfolds
+            )
+
+        # Checkpoint the unfolds in chunks so backprop only keeps the chunk
+        # boundary states instead of every solver stage
+        done = 0
+        while done < self._ode_unfolds:
+            num_unfolds = min(self.checkpoint_every, self._ode_unfolds - done)
+            v_pre = self._checkpointed_unfold(
+                v_pre, w_numerator_sensory, w_denominator_sensory, dt, num_unfolds
+            )
+            done += num_unfolds
+
+        return v_pre
+
+    def _ode_unfold(self, v_pre, w_numerator_sensory, w_denominator_sensory, dt, num_unfolds):
+        """
+        Run a number of ODE unfolds starting from the given state.
+
+        Args:
+            v_pre: State before the first unfold
+            w_numerator_sensory: Sensory contribution to the numerator
+            w_denominator_sensory: Sensory contribution to the denominator
+            dt: Step size of a single unfold
+            num_unfolds: Number of unfolds to run
+
+        Returns:
+            State after the last unfold
+        """
+        def synapses(v_pre):
+            w_activation = self.weight * self._sigmoid(v_pre, self.mu, self.sigma)
+            w_activation = w_activation * self._sparsity_mask
+            rev_activation = w_activation * self.erev
+
+            # Reduce over the source neurons
+            w_numerator = mx.sum(rev_activation, axis=1) + w_numerator_sensory
+            w_denominator = mx.sum(w_activation, axis=1) + w_denominator_sensory
+            return w_numerator, w_denominator
+
+        def f(_, v_pre):
+            w_numerator, w_denominator = synapses(v_pre)
 
-        # ODE unfolds
-        for _ in range(self._ode_unfolds):
-            def f(_, v_pre):
-                w_activation = self.weight * self._sigmoid(v_pre, self.mu, self.sigma)
-                rev_activation = w_activation * self.erev
-                
-                w_numerator = mx.sum(rev_activation, axis=1) + w_numerator_sensory
-                w_denominator = mx.sum(w_activation, axis=1) + w_denominator_sensory
+            # cm * dv/dt = gleak * (vleak - v) + sum_j w_j * (erev_j - v)
+            current = self.gleak * (self.vleak - v_pre) + w_numerator - w_denominator * v_pre
+            return current / (self.cm + self.epsilon)
 
-                numerator = cm_t * v_pre + self.gleak * self.vleak + w_numerator
-                denominator = cm_t + self.gleak + w_denominator
+        # cm/dt is loop invariant
+        cm_t = self.cm / dt
 
-                return numerator / (denominator + self.epsilon)
+        def fused_step(v_pre):
+            w_numerator, w_denominator = synapses(v_pre)
 
-            v_pre = self.ode_solver(f, v_pre, 0, 1.0 / self._ode_unfolds)
+            # Implicit Euler in v with the synaptic activations held at v_pre
+            numerator = cm_t * v_pre + self.gleak * self.vleak + w_numerator
+            denominator = cm_t + self.gleak + w_denominator
+            return numerator / (denominator + self.epsilon)
+
+        for _ in range(num_unfolds):
+            if self.solver == "fused":
+                v_pre = fused_step(v_pre)
+            else:
+                v_pre = self.ode_solver(f, v_pre, 0, dt)
 
         return v_pre
 
+    def _map_inputs(self, inputs):
+        """Apply the input mapping."""
+        if self.input_mapping in ["affine", "linear"]:
+            inputs = inputs * self.input_w
+        if self.input_mapping == "affine":
+            inputs = inputs + self.input_b
+        return inputs
+
+    def _map_outputs(self, output):
+        """Apply the output mapping."""
+        if self.output_mapping in ["affine", "linear"]:
+            output = output * self.output_w
+        if self.output_mapping == "affine":
+            output = output + self.output_b
+        return output
+
     def __call__(self, inputs, state=None, time=1.0):
         """
         Process one time step.
@@ -158,35 +363,62 @@ class ELTCCell(LTCCell):
         Returns:
             Tuple of (output, new_state)
         """
+        # Build lazy parameters if not built
+        if not hasattr(self, 'weight'):
+            self.wiring.build(inputs.shape[-1])
+            self.build()
+
         batch_size = inputs.shape[0]
         if state is None:
             state = mx.zeros((batch_size, self.units))
 
-        new_state = self._ode_solver(inputs, state, time)
+        new_state = self._ode_solver(self._map_inputs(inputs), state, time)
         output = self.activation(new_state)
 
         if self.output_dim != self.units:
             output = output[:, :self.output_dim]
 
-        return output, new_state
+        return self._map_outputs(output), new_state
 
     def get_config(self):
         """Get configuration for serialization."""
         config = super().get_config()
         config.update({
+            "wiring": {
+                "class_name": type(self.wiring).__name__,
+                "config": self.wiring.get_config(),
+            },
+            "input_mapping": self.input_mapping,
+            "output_mapping": self.output_mapping,
             "solver": self.solver,
+            "ode_unfolds": self._ode_unfolds,
+            "epsilon": self.epsilon,
+            "initialization_ranges": self.initialization_ranges,
+            "forget_gate_bias": self.forget_gate_bias,
             "sparsity": self.sparsity,
             "activation": self.activation,
+            "checkpoint_every": self.checkpoint_every,
         })
         return config
 
     @classmethod
     def from_config(cls, config):
         """Create instance from configuration."""
-        base_config = LTCCell.from_config(config)
+        wiring_config = config["wiring"]
+        wiring_class = getattr(wirings, wiring_config["class_name"])
         return cls(
-            **base_config,
+            wiring=wiring_class.from_config(wiring_config["config"]),
+            input_mapping=config["input_mapping"],
+            output_mapping=config["output_mapping"],
             solver=config["solver"],
+            ode_unfolds=config["ode_unfolds"],
+            epsilon=config["epsilon"],
+            initialization_ranges=config["initialization_ranges"],
+            forget_gate_bias=config["forget_gate_bias"],
             sparsity=config["sparsity"],
             activation=config["activation"],
+            checkpoint_every=config["checkpoint_every"],
+            backbone_units=config["backbone_units"],
+            backbone_layers=config["backbone_layers"],
+            backbone_dropout=config["backbone_dropout"],
         )
@@ -130,6 +130,13 @@ class LTC(LiquidRNN):
                 if self.bidirectional:
                     initial_states.append(mx.zeros((batch_size, self.hidden_size)))
         
+        # Slice the per-step time deltas once; every layer and direction
+        # reuses them
+        step_times = [
+            time_delta[:, t] if time_delta is not None else 1.0
+            for t in range(seq_len)
+        ]
+        
         # Process each layer
         current_input = x
         final_states = []
@@ -138,16 +145,25 @@ class LTC(LiquidRNN):
             forward_cell = self.forward_layers[layer]
             backward_cell = self.backward_layers[layer] if self.bidirectional else None
             
+            # Only the top layer may return a single step; since MLX is lazy,
+            # per-step outputs that are never stacked are never computed
+            keep_sequence = self.return_sequences or layer < self.num_layers - 1
+            
+            # Slice the layer input once so the backward pass reuses the steps
+            step_inputs = [current_input[:, t] for t in range(seq_len)]
+            
             # Forward pass
             forward_states = []
             state = initial_states[layer * (2 if self.bidirectional else 1)]
             
             for t in range(seq_len):
-                dt = time_delta[:, t] if time_delta is not None else 1.0
-                output, state = forward_cell(current_input[:, t], state, time=dt)
+                output, state = forward_cell(step_inputs[t], state, time=step_times[t])
                 forward_states.append(output)
             
-            forward_output = mx.stack(forward_states, axis=1)
+            if keep_sequence:
+                forward_output = mx.stack(forward_states, axis=1)
+            else:
+                forward_output = forward_states[-1]
             final_states.append(state)
             
             # Backward pass if bidirectional
@@ -156,11 +172,14 @@ class LTC(LiquidRNN):
                 state = initial_states[layer * 2 + 1]
                 
                 for t in range(seq_len - 1, -1, -1):
-                    dt = time_delta[:, t] if time_delta is not None else 1.0
-                    output, state = backward_cell(current_input[:, t], state, time=dt)
+                    output, state = backward_cell(step_inputs[t], state, time=step_times[t])
                     backward_states.append(output)
                 
-                backward_output = mx.stack(backward_states[::-1], axis=1)
+                if keep_sequence:
+                    backward_output = mx.stack(backward_states[::-1], axis=1)
+                else:
+                    # The backward output aligned with the last step is its first
+                    backward_output = backward_states[0]
                 final_states.append(state)
                 
                 # Combine forward and backward outputs
@@ -168,10 +187,6 @@ class LTC(LiquidRNN):
             else:
                 current_input = forward_output
         
-        # Prepare output
-        if not self.return_sequences:
-            current_input = current_input[:, -1]
-            
         if self.return_state:
             return current_input, final_states
         return current_input
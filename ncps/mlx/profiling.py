@@ -3,6 +3,8 @@
 import time
 from typing import Dict, List, Optional, Tuple, Union
 import mlx.core as mx
+import mlx.nn as nn
+import mlx.optimizers as optim
 import numpy as np
 from ncps.mlx.wirings import Wiring
 
@@ -116,24 +118,28 @@ class WiringProfiler:
         x = mx.random.normal((batch_size, seq_length, input_size))
         y = mx.random.normal((batch_size, seq_length, self.wiring.output_dim))
         
-        optimizer = mx.optimizers.Adam(learning_rate=0.001)
+        optimizer = optim.Adam(learning_rate=0.001)
         
         def loss_fn(model, x, y):
             pred = model(x)
-            return mx.mean((pred - y) ** 2)
+            return mx.mean(mx.square(pred - y))
         
-        # Warmup
-        loss, grads = mx.value_and_grad(model, loss_fn)(model, x, y)
+        # Differentiate w.r.t. the model's trainable parameters directly
+        loss_and_grad = nn.value_and_grad(model, loss_fn)
+        
+        # Warmup (the forward pass builds any lazily created parameters)
+        model(x)
+        loss, grads = loss_and_grad(model, x, y)
         optimizer.update(model, grads)
-        mx.eval()
+        mx.eval(loss, model.parameters(), optimizer.state)
         
         # Time backward passes
         times = []
         for _ in range(num_runs):
             start = time.time()
-            loss, grads = mx.value_and_grad(model, loss_fn)(model, x, y)
+            loss, grads = loss_and_grad(model, x, y)
             optimizer.update(model, grads)
-            mx.eval()
+            mx.eval(loss, model.parameters(), optimizer.state)
             times.append(time.time() - start)
         
         stats = {
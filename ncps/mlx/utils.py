@@ -1,4 +1,5 @@
 import mlx.core as mx
+import mlx.nn as nn
 import json
 from pathlib import Path
 from typing import Union, Dict, Any
@@ -55,4 +56,43 @@ def load_model(model: Any, filepath: Union[str, Path]) -> None:
         return obj
     
     state = convert_to_arrays(state)
-    model.load_state_dict(state)
\ No newline at end of file
+    model.load_state_dict(state)
+
+def quantize_backbone(model: nn.Module, group_size: int = 64, bits: int = 8) -> int:
+    """Quantize the backbone layers of every liquid cell in a model for inference.
+    
+    Backbone ``nn.Linear`` layers are replaced in place by ``nn.QuantizedLinear``,
+    which cuts the weight bytes read per time step by 4x at 8 bits. Layers whose
+    input dimension is not a multiple of ``group_size`` stay in full precision.
+    Quantized weights are not trainable, so keep the full precision weights
+    (e.g. via ``save_model``) if the model needs further training.
+    
+    Args:
+        model: The MLX model (or single cell) to quantize
+        group_size: Number of weights sharing one scale and bias
+        bits: Bits per quantized weight
+        
+    Returns:
+        Number of backbone layers that were quantized
+    """
+    from .base import LiquidCell
+    
+    def class_predicate(_, module):
+        return isinstance(module, nn.Linear) and module.weight.shape[-1] % group_size == 0
+    
+    def num_quantized(module):
+        return sum(isinstance(m, nn.QuantizedLinear) for m in module.modules())
+    
+    count = 0
+    for _, module in model.named_modules():
+        if isinstance(module, LiquidCell) and module.backbone is not None:
+            before = num_quantized(module.backbone)
+            nn.quantize(
+                module.backbone,
+                group_size=group_size,
+                bits=bits,
+                class_predicate=class_predicate,
+            )
+            count += num_quantized(module.backbone) - before
+    
+    return count
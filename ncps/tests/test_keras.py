@@ -293,3 +293,31 @@ def test_time_handling():
     # Test forward pass
     output = model(x)
     assert output.shape == (batch_size, seq_length, 1)
+
+
+def test_cfc_time_inputs():
+    """Test CfC with packed [inputs, elapsed times]."""
+    input_size = 8
+    hidden_size = 16
+    wiring = FullyConnected(units=hidden_size, output_dim=hidden_size)
+    wiring.build(input_size)
+    
+    batch_size = 4
+    seq_length = 10
+    x = np.random.normal(size=(batch_size, seq_length, input_size)).astype(np.float32)
+    
+    model = CfC(wiring=wiring)
+    reference = CfC(wiring=wiring)
+    reference(x)
+    
+    # Unit elapsed times must match the regularly sampled model
+    ones = np.ones((batch_size, seq_length), dtype=np.float32)
+    model([x, ones])
+    model.set_weights(reference.get_weights())
+    output = model([x, ones])
+    assert output.shape == (batch_size, seq_length, hidden_size)
+    np.testing.assert_allclose(output, reference(x), atol=1e-6)
+    
+    # Other elapsed times change the result
+    halves = np.full((batch_size, seq_length, 1), 0.5, dtype=np.float32)
+    assert not np.allclose(model([x, halves]), output)
@@ -1,9 +1,11 @@
 """Tests for wired liquid neurons."""
 
 import mlx.core as mx
+import mlx.nn as nn
 import numpy as np
 import pytest
-from ncps.mlx import CfC, LTC
+from mlx.utils import tree_flatten
+from ncps.mlx import CfC, LTC, ELTCCell, quantize_backbone
 from ncps.mlx.wirings import FullyConnected, Random, NCP, AutoNCP
 
 
@@ -432,3 +434,180 @@ def test_wiring_connectivity_patterns():
     total_possible = 32 * 32
     assert wiring_auto.synapse_count < total_possible  # Should be sparse
     assert wiring_auto.synapse_count > 0  # Should have some connections
+
+
+def test_quantized_backbone_inference():
+    """Test inference with a quantized backbone."""
+    # Create wiring and model (input + units = 64 matches the group size)
+    input_dim = 16
+    wiring = FullyConnected(units=48, output_dim=4)
+    wiring.build(input_dim)
+    model = CfC(wiring=wiring, backbone_units=64, backbone_layers=2)
+    model.eval()
+    
+    batch_size = 8
+    seq_length = 10
+    x = mx.random.normal((batch_size, seq_length, input_dim))
+    reference = model(x)
+    
+    cell = model.forward_layers[0]
+    num_linear = sum(isinstance(layer, nn.Linear) for layer in cell.backbone.layers)
+    assert num_linear == 2
+
+    # The model keeps its template cell alongside the per-layer cells
+    cells = [model.cell, *model.forward_layers]
+    assert quantize_backbone(model, group_size=64, bits=8) == len(cells) * num_linear
+
+    # Backbone linear layers are replaced, the cell's own weights are not
+    quantized = [
+        layer for layer in cell.backbone.layers
+        if isinstance(layer, nn.QuantizedLinear)
+    ]
+    assert len(quantized) == num_linear
+    assert all(layer.bits == 8 for layer in quantized)
+    assert not any(
+        type(layer) is nn.Linear for layer in cell.backbone.layers
+    )
+    assert cell.ff1_kernel.dtype == mx.float32
+    
+    output = model(x)
+    assert output.shape == reference.shape
+    assert float(mx.max(mx.abs(output - reference))) < 0.1
+
+
+def test_quantized_backbone_skips_unaligned_layers():
+    """Test that backbone layers not divisible by the group size are skipped."""
+    # input + units = 10, so only the second backbone layer can be quantized
+    input_dim = 2
+    wiring = FullyConnected(units=8, output_dim=1)
+    wiring.build(input_dim)
+    model = CfC(wiring=wiring, backbone_units=64, backbone_layers=2)
+    model.eval()
+    
+    x = mx.random.normal((4, 10, input_dim))
+    reference = model(x)
+    
+    cells = [model.cell, *model.forward_layers]
+    assert quantize_backbone(model, group_size=64, bits=8) == len(cells)
+    
+    for cell in cells:
+        layers = cell.backbone.layers
+        assert type(layers[0]) is nn.Linear
+        assert isinstance(layers[-1], nn.QuantizedLinear)
+    
+    output = model(x)
+    assert output.shape == reference.shape
+    assert float(mx.max(mx.abs(output - reference))) < 0.1
+
+
+def test_eltc_cell_solvers():
+    """Test the ELTC cell with every ODE solver."""
+    input_dim = 4
+    wiring = FullyConnected(units=8, output_dim=2)
+    wiring.build(input_dim)
+    x = mx.random.normal((3, input_dim))
+    
+    for solver in ["rk4", "euler", "semi_implicit", "fused"]:
+        cell = ELTCCell(wiring, solver=solver, ode_unfolds=6)
+        output, state = cell(x)
+        assert output.shape == (3, 2)
+        assert state.shape == (3, 8)
+        assert not mx.any(mx.isnan(state))
+    
+    # The fused update averages v, vleak and erev, so any step size is stable
+    cell = ELTCCell(wiring, solver="fused", ode_unfolds=1)
+    _, state = cell(x, time=100.0)
+    assert mx.all(mx.abs(state) <= 1.0)
+    
+    with pytest.raises(ValueError):
+        ELTCCell(wiring, solver="midpoint")(x)
+
+def test_eltc_checkpointing_gradient_parity():
+    """Test that checkpointed ODE unfolds keep the loss and gradients."""
+    input_dim = 4
+    wiring = FullyConnected(units=8, output_dim=2)
+    wiring.build(input_dim)
+    
+    batch_size = 3
+    seq_length = 5
+    x = mx.random.normal((batch_size, seq_length, input_dim))
+    
+    def loss_fn(cell, x):
+        state = None
+        for t in range(seq_length):
+            output, state = cell(x[:, t], state)
+        return mx.mean(mx.square(output))
+    
+    results = []
+    for checkpoint_every in [0, 1, 4, 6]:
+        # Same seed so every cell starts from identical parameters
+        mx.random.seed(0)
+        cell = ELTCCell(wiring, ode_unfolds=6, checkpoint_every=checkpoint_every)
+        loss, grads = nn.value_and_grad(cell, loss_fn)(cell, x)
+        results.append((loss, dict(tree_flatten(grads))))
+    
+    reference_loss, reference_grads = results[0]
+    for loss, grads in results[1:]:
+        assert mx.allclose(loss, reference_loss)
+        assert grads.keys() == reference_grads.keys()
+        for name, grad in grads.items():
+            assert mx.allclose(grad, reference_grads[name], atol=1e-6), name
+
+
+def test_eltc_checkpointing_reduces_peak_memory():
+    """Test that checkpointed ODE unfolds lower the peak memory of backprop."""
+    input_dim = 8
+    wiring = FullyConnected(units=32, output_dim=1)
+    wiring.build(input_dim)
+    
+    batch_size = 16
+    seq_length = 20
+    x = mx.random.normal((batch_size, seq_length, input_dim))
+    
+    def loss_fn(cell, x):
+        state = None
+        for t in range(seq_length):
+            output, state = cell(x[:, t], state)
+        return mx.mean(mx.square(output))
+    
+    peaks = {}
+    for checkpoint_every in [0, 1]:
+        mx.random.seed(0)
+        cell = ELTCCell(
+            wiring, solver="fused", ode_unfolds=6, checkpoint_every=checkpoint_every
+        )
+        mx.eval(cell.parameters(), x)
+        
+        mx.reset_peak_memory()
+        baseline = mx.get_active_memory()
+        loss, grads = nn.value_and_grad(cell, loss_fn)(cell, x)
+        mx.eval(loss, grads)
+        peaks[checkpoint_every] = mx.get_peak_memory() - baseline
+    
+    # Without checkpointing every unfold's synaptic activations are kept
+    assert peaks[1] < peaks[0] / 4, peaks
+
+
+def test_eltc_config_round_trip():
+    """Test that an ELTC cell can be recreated from its config."""
+    wiring = AutoNCP(units=16, output_size=2)
+    wiring.build(3)
+    cell = ELTCCell(
+        wiring,
+        input_mapping="linear",
+        solver="fused",
+        ode_unfolds=4,
+        epsilon=1e-6,
+        checkpoint_every=2,
+    )
+    config = cell.get_config()
+    
+    restored = ELTCCell.from_config(config)
+    restored_config = restored.get_config()
+    for key in ["wiring", "input_mapping", "output_mapping", "solver",
+                "ode_unfolds", "epsilon", "sparsity", "checkpoint_every"]:
+        assert restored_config[key] == config[key], key
+    
+    output, state = restored(mx.random.normal((2, 3)))
+    assert output.shape == (2, 2)
+    assert state.shape == (2, 16)